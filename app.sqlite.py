@@ -6,11 +6,157 @@ Aplicação Python para gerenciar notas sem necessidade de PostgreSQL
 """
 
 import sqlite3
-from typing import List, Dict, Optional
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 import os
 
 
+# ==================== COMANDOS SQL ====================
+# Constantes de módulo: o mesmo objeto str é passado em toda chamada,
+# maximizando o acerto no cache de statements do sqlite3
+
+SQL_INSERIR_ALUNO = "INSERT INTO alunos (matricula, nome) VALUES (?, ?)"
+
+SQL_LISTAR_ALUNOS = "SELECT id, matricula, nome, data_cadastro FROM alunos ORDER BY nome"
+
+SQL_BUSCAR_ALUNO = "SELECT id, matricula, nome, data_cadastro FROM alunos WHERE matricula = ?"
+
+SQL_ID_ALUNO = "SELECT id FROM alunos WHERE matricula = ?"
+
+SQL_INSERIR_DISCIPLINA = "INSERT INTO disciplinas (codigo, nome, carga_horaria) VALUES (?, ?, ?)"
+
+SQL_LISTAR_DISCIPLINAS = "SELECT id, codigo, nome, carga_horaria FROM disciplinas ORDER BY nome"
+
+SQL_ID_DISCIPLINA = "SELECT id FROM disciplinas WHERE codigo = ?"
+
+SQL_INSERIR_NOTAS = """
+    INSERT INTO notas (aluno_id, disciplina_id, nota1, nota2, nota3, semestre)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+SQL_ATUALIZAR_NOTAS = """
+    UPDATE notas
+    SET nota1 = ?, nota2 = ?, nota3 = ?
+    WHERE aluno_id = (SELECT id FROM alunos WHERE matricula = ?)
+    AND disciplina_id = (SELECT id FROM disciplinas WHERE codigo = ?)
+    AND semestre = ?
+"""
+
+SQL_SITUACAO_ALUNO = """
+    SELECT
+        a.matricula,
+        a.nome AS aluno,
+        d.codigo AS cod_disciplina,
+        d.nome AS disciplina,
+        n.nota1,
+        n.nota2,
+        n.nota3,
+        n.media,
+        CASE
+            WHEN n.media >= 7.0 THEN 'APROVADO'
+            ELSE 'REPROVADO'
+        END AS situacao,
+        n.semestre
+    FROM notas n
+    INNER JOIN alunos a ON n.aluno_id = a.id
+    INNER JOIN disciplinas d ON n.disciplina_id = d.id
+    WHERE a.matricula = ?
+    ORDER BY d.nome
+"""
+
+SQL_TODAS_SITUACOES = """
+    SELECT
+        a.matricula,
+        a.nome AS aluno,
+        d.codigo AS cod_disciplina,
+        d.nome AS disciplina,
+        n.nota1,
+        n.nota2,
+        n.nota3,
+        n.media,
+        CASE
+            WHEN n.media >= 7.0 THEN 'APROVADO'
+            ELSE 'REPROVADO'
+        END AS situacao,
+        n.semestre
+    FROM notas n
+    INNER JOIN alunos a ON n.aluno_id = a.id
+    INNER JOIN disciplinas d ON n.disciplina_id = d.id
+    ORDER BY a.nome, d.nome
+"""
+
+# CTE compartilhada: as consultas de resumo/aprovados/reprovados usam a
+# mesma agregação por (aluno, semestre), variando só o filtro final
+_SQL_AGG_NOTAS = """
+    WITH agg AS (
+        SELECT
+            a.matricula,
+            a.nome,
+            n.semestre,
+            COUNT(*) AS total_disciplinas,
+            SUM(CASE WHEN n.media >= 7.0 THEN 1 ELSE 0 END) AS aprovado,
+            SUM(CASE WHEN n.media < 7.0 THEN 1 ELSE 0 END) AS reprovado,
+            ROUND(AVG(n.media), 2) AS media_geral
+        FROM alunos a
+        INNER JOIN notas n ON a.id = n.aluno_id
+        GROUP BY a.matricula, a.nome, n.semestre
+    )
+"""
+
+SQL_TODAS_SITUACOES_BRUTO = """
+    SELECT
+        a.matricula,
+        a.nome AS aluno,
+        d.codigo AS cod_disciplina,
+        d.nome AS disciplina,
+        n.nota1,
+        n.nota2,
+        n.nota3,
+        n.semestre
+    FROM notas n
+    INNER JOIN alunos a ON n.aluno_id = a.id
+    INNER JOIN disciplinas d ON n.disciplina_id = d.id
+    ORDER BY a.nome, d.nome
+"""
+
+SQL_RESUMO_ALUNO = _SQL_AGG_NOTAS + """
+    SELECT matricula, nome, semestre, total_disciplinas, aprovado, reprovado, media_geral
+    FROM agg
+    WHERE (:mat IS NULL OR matricula = :mat)
+    ORDER BY nome
+"""
+
+SQL_APROVADOS = _SQL_AGG_NOTAS + """
+    SELECT matricula, nome, semestre, total_disciplinas, aprovado, reprovado, media_geral
+    FROM agg
+    WHERE reprovado = 0
+    ORDER BY media_geral DESC
+"""
+
+SQL_REPROVADOS = _SQL_AGG_NOTAS + """
+    SELECT matricula, nome, semestre, reprovado AS disciplinas_reprovadas, media_geral
+    FROM agg
+    WHERE reprovado > 0
+    ORDER BY disciplinas_reprovadas DESC, media_geral ASC
+"""
+
+SQL_ESTATISTICAS_SEMESTRE = """
+    SELECT
+        ? AS semestre,
+        COUNT(DISTINCT aluno_id) AS total_alunos,
+        COUNT(*) AS total_matriculas,
+        SUM(CASE WHEN media >= 7.0 THEN 1 ELSE 0 END) AS total_aprovacoes,
+        SUM(CASE WHEN media < 7.0 THEN 1 ELSE 0 END) AS total_reprovacoes,
+        ROUND(AVG(media), 2) AS media_geral,
+        ROUND(100.0 * SUM(CASE WHEN media >= 7.0 THEN 1 ELSE 0 END) / COUNT(*), 2) AS taxa_aprovacao
+    FROM notas
+    WHERE semestre = ?
+"""
+
+
 class SistemaNotas:
     """Classe principal para gerenciar o sistema de notas com SQLite"""
     
@@ -22,14 +168,94 @@ class SistemaNotas:
             db_file: Nome do arquivo do banco de dados
         """
         try:
-            self.conn = sqlite3.connect(db_file)
+            self.conn = sqlite3.connect(db_file, cached_statements=256)
+            # Autocommit: sem BEGIN implícito por comando; transações em
+            # lote são abertas explicitamente via transaction()
+            self.conn.isolation_level = None
+            self.conn.row_factory = sqlite3.Row
+            self._configurar_pragmas(db_file)
             self.cursor = self.conn.cursor()
+            self._stmt_cache: Dict[str, sqlite3.Cursor] = {}
+            # Memoização matrícula->id / código->id: os IDs são estáveis
+            # durante a vida do processo
+            self._cache_aluno_id: Dict[str, int] = {}
+            self._cache_disciplina_id: Dict[str, int] = {}
+            # Em uso programático (scripts de carga), desligar o verbose
+            # evita um print por linha inserida
+            self.verbose = True
             self._criar_tabelas()
             print(f"✓ Conexão com banco de dados '{db_file}' estabelecida com sucesso!")
         except Exception as e:
             print(f"✗ Erro ao conectar ao banco de dados: {e}")
             raise
     
+    def _configurar_pragmas(self, db_file):
+        """Configura PRAGMAs de desempenho na conexão"""
+        # WAL permite leituras concorrentes com escritas e reduz fsyncs por
+        # commit; não se aplica a bancos em memória
+        if db_file != ':memory:':
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+
+    def _exec(self, sql: str, params=()) -> sqlite3.Cursor:
+        """
+        Executa um comando SQL reutilizando um cursor dedicado por comando
+
+        O sqlite3 mantém o statement compilado no cursor entre execuções do
+        mesmo SQL, evitando re-parse e re-planejamento nas consultas quentes.
+        """
+        cursor = self._stmt_cache.get(sql)
+        if cursor is None:
+            cursor = self.conn.cursor()
+            self._stmt_cache[sql] = cursor
+        cursor.execute(sql, params)
+        return cursor
+
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa várias operações em uma única transação explícita
+
+        Uso: with sistema.transaction(): sistema.adicionar_notas(...)
+        """
+        self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            # IDs memoizados durante a transação apontariam para linhas
+            # que o rollback desfez
+            self._cache_aluno_id.clear()
+            self._cache_disciplina_id.clear()
+            raise
+        else:
+            self.conn.execute("COMMIT")
+
+    def _aluno_id(self, matricula: str) -> Optional[int]:
+        """Resolve o id de um aluno pela matrícula, com memoização"""
+        aluno_id = self._cache_aluno_id.get(matricula)
+        if aluno_id is None:
+            row = self._exec(SQL_ID_ALUNO, (matricula,)).fetchone()
+            if row is None:
+                return None
+            aluno_id = row['id']
+            self._cache_aluno_id[matricula] = aluno_id
+        return aluno_id
+
+    def _disciplina_id(self, codigo: str) -> Optional[int]:
+        """Resolve o id de uma disciplina pelo código, com memoização"""
+        disciplina_id = self._cache_disciplina_id.get(codigo)
+        if disciplina_id is None:
+            row = self._exec(SQL_ID_DISCIPLINA, (codigo,)).fetchone()
+            if row is None:
+                return None
+            disciplina_id = row['id']
+            self._cache_disciplina_id[codigo] = disciplina_id
+        return disciplina_id
+
     def _criar_tabelas(self):
         """Cria as tabelas se não existirem"""
         # Tabela de Alunos
@@ -52,124 +278,88 @@ class SistemaNotas:
             )
         """)
         
-        # Tabela de Notas
+        # Tabela de Notas: a chave natural (aluno, disciplina, semestre) é
+        # a própria PRIMARY KEY; WITHOUT ROWID armazena a linha direto na
+        # folha da árvore da chave, sem a B-tree extra do rowid
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS notas (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 aluno_id INTEGER NOT NULL,
                 disciplina_id INTEGER NOT NULL,
-                nota1 REAL CHECK (nota1 >= 0 AND nota1 <= 10),
-                nota2 REAL CHECK (nota2 >= 0 AND nota2 <= 10),
-                nota3 REAL CHECK (nota3 >= 0 AND nota3 <= 10),
+                nota1 REAL CHECK (nota1 BETWEEN 0 AND 10),
+                nota2 REAL CHECK (nota2 BETWEEN 0 AND 10),
+                nota3 REAL CHECK (nota3 BETWEEN 0 AND 10),
+                media REAL GENERATED ALWAYS AS ((nota1 + nota2 + nota3) / 3.0) STORED,
                 semestre TEXT NOT NULL,
+                PRIMARY KEY (aluno_id, disciplina_id, semestre),
                 FOREIGN KEY (aluno_id) REFERENCES alunos(id) ON DELETE CASCADE,
-                FOREIGN KEY (disciplina_id) REFERENCES disciplinas(id) ON DELETE CASCADE,
-                UNIQUE(aluno_id, disciplina_id, semestre)
-            )
+                FOREIGN KEY (disciplina_id) REFERENCES disciplinas(id) ON DELETE CASCADE
+            ) WITHOUT ROWID
         """)
-        
-        self.conn.commit()
+
+        # Índices de apoio às consultas: a PRIMARY KEY acima só cobre
+        # buscas pela coluna líder (aluno_id)
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notas_disc ON notas(disciplina_id)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notas_semestre ON notas(semestre)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notas_media ON notas(media)"
+        )
     
-    def __del__(self):
-        """Fecha a conexão ao destruir o objeto"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Fecha a conexão de forma determinística ao sair do bloco with"""
+        # PRAGMA optimize grava estatísticas de uso para o planejador de
+        # consultas das próximas execuções (receita oficial do SQLite)
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
     
     # ==================== ALUNOS ====================
     
     def adicionar_aluno(self, matricula: str, nome: str) -> bool:
         """Adiciona um novo aluno"""
         try:
-            self.cursor.execute(
-                "INSERT INTO alunos (matricula, nome) VALUES (?, ?)",
-                (matricula, nome)
-            )
-            self.conn.commit()
-            print(f"✓ Aluno {nome} (matrícula {matricula}) adicionado com sucesso!")
+            cursor = self._exec(SQL_INSERIR_ALUNO, (matricula, nome))
+            self._cache_aluno_id[matricula] = cursor.lastrowid
+            if self.verbose:
+                print(f"✓ Aluno {nome} (matrícula {matricula}) adicionado com sucesso!")
             return True
         except sqlite3.IntegrityError:
             print(f"✗ Erro: Matrícula {matricula} já existe!")
             return False
-        except Exception as e:
-            print(f"✗ Erro ao adicionar aluno: {e}")
-            return False
-    
+
     def listar_alunos(self) -> List[Dict]:
         """Lista todos os alunos cadastrados"""
-        try:
-            self.cursor.execute(
-                "SELECT id, matricula, nome, data_cadastro FROM alunos ORDER BY nome"
-            )
-            alunos = []
-            for row in self.cursor.fetchall():
-                alunos.append({
-                    'id': row[0],
-                    'matricula': row[1],
-                    'nome': row[2],
-                    'data_cadastro': row[3]
-                })
-            return alunos
-        except Exception as e:
-            print(f"✗ Erro ao listar alunos: {e}")
-            return []
-    
+        cursor = self._exec(SQL_LISTAR_ALUNOS)
+        return [dict(row) for row in cursor]
+
     def buscar_aluno(self, matricula: str) -> Optional[Dict]:
         """Busca um aluno pela matrícula"""
-        try:
-            self.cursor.execute(
-                "SELECT id, matricula, nome, data_cadastro FROM alunos WHERE matricula = ?",
-                (matricula,)
-            )
-            row = self.cursor.fetchone()
-            if row:
-                return {
-                    'id': row[0],
-                    'matricula': row[1],
-                    'nome': row[2],
-                    'data_cadastro': row[3]
-                }
-            return None
-        except Exception as e:
-            print(f"✗ Erro ao buscar aluno: {e}")
-            return None
+        row = self._exec(SQL_BUSCAR_ALUNO, (matricula,)).fetchone()
+        return dict(row) if row else None
     
     # ==================== DISCIPLINAS ====================
     
     def adicionar_disciplina(self, codigo: str, nome: str, carga_horaria: int) -> bool:
         """Adiciona uma nova disciplina"""
         try:
-            self.cursor.execute(
-                "INSERT INTO disciplinas (codigo, nome, carga_horaria) VALUES (?, ?, ?)",
-                (codigo, nome, carga_horaria)
-            )
-            self.conn.commit()
-            print(f"✓ Disciplina {nome} ({codigo}) adicionada com sucesso!")
+            cursor = self._exec(SQL_INSERIR_DISCIPLINA, (codigo, nome, carga_horaria))
+            self._cache_disciplina_id[codigo] = cursor.lastrowid
+            if self.verbose:
+                print(f"✓ Disciplina {nome} ({codigo}) adicionada com sucesso!")
             return True
         except sqlite3.IntegrityError:
             print(f"✗ Erro: Código {codigo} já existe!")
             return False
-        except Exception as e:
-            print(f"✗ Erro ao adicionar disciplina: {e}")
-            return False
-    
+
     def listar_disciplinas(self) -> List[Dict]:
         """Lista todas as disciplinas cadastradas"""
-        try:
-            self.cursor.execute(
-                "SELECT id, codigo, nome, carga_horaria FROM disciplinas ORDER BY nome"
-            )
-            disciplinas = []
-            for row in self.cursor.fetchall():
-                disciplinas.append({
-                    'id': row[0],
-                    'codigo': row[1],
-                    'nome': row[2],
-                    'carga_horaria': row[3]
-                })
-            return disciplinas
-        except Exception as e:
-            print(f"✗ Erro ao listar disciplinas: {e}")
-            return []
+        cursor = self._exec(SQL_LISTAR_DISCIPLINAS)
+        return [dict(row) for row in cursor]
     
     # ==================== NOTAS ====================
     
@@ -177,299 +367,137 @@ class SistemaNotas:
                        nota1: float, nota2: float, nota3: float, semestre: str) -> bool:
         """Adiciona notas para um aluno em uma disciplina"""
         try:
-            # Buscar IDs
-            self.cursor.execute("SELECT id FROM alunos WHERE matricula = ?", (matricula,))
-            aluno = self.cursor.fetchone()
-            if not aluno:
+            # Com os IDs memoizados o caminho quente vira um INSERT puro,
+            # sem nenhum SELECT de resolução
+            aluno_id = self._aluno_id(matricula)
+            if aluno_id is None:
                 print(f"✗ Aluno com matrícula {matricula} não encontrado!")
                 return False
-            
-            self.cursor.execute("SELECT id FROM disciplinas WHERE codigo = ?", (codigo_disciplina,))
-            disciplina = self.cursor.fetchone()
-            if not disciplina:
+
+            disciplina_id = self._disciplina_id(codigo_disciplina)
+            if disciplina_id is None:
                 print(f"✗ Disciplina com código {codigo_disciplina} não encontrada!")
                 return False
-            
-            # Inserir notas
-            self.cursor.execute(
-                """INSERT INTO notas (aluno_id, disciplina_id, nota1, nota2, nota3, semestre) 
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (aluno[0], disciplina[0], nota1, nota2, nota3, semestre)
+
+            self._exec(
+                SQL_INSERIR_NOTAS,
+                (aluno_id, disciplina_id, nota1, nota2, nota3, semestre)
             )
-            self.conn.commit()
             
-            media = (nota1 + nota2 + nota3) / 3
-            situacao = "APROVADO" if media >= 7.0 else "REPROVADO"
-            print(f"✓ Notas adicionadas! Média: {media:.2f} - Situação: {situacao}")
+            if self.verbose:
+                media = (nota1 + nota2 + nota3) / 3
+                situacao = "APROVADO" if media >= 7.0 else "REPROVADO"
+                print(f"✓ Notas adicionadas! Média: {media:.2f} - Situação: {situacao}")
             return True
         except sqlite3.IntegrityError:
             print(f"✗ Erro: Notas já existem para este aluno/disciplina/semestre!")
             return False
-        except Exception as e:
-            print(f"✗ Erro ao adicionar notas: {e}")
-            return False
     
     def atualizar_notas(self, matricula: str, codigo_disciplina: str,
                        nota1: float, nota2: float, nota3: float, semestre: str) -> bool:
         """Atualiza notas de um aluno em uma disciplina"""
-        try:
-            self.cursor.execute(
-                """UPDATE notas 
-                   SET nota1 = ?, nota2 = ?, nota3 = ?
-                   WHERE aluno_id = (SELECT id FROM alunos WHERE matricula = ?)
-                   AND disciplina_id = (SELECT id FROM disciplinas WHERE codigo = ?)
-                   AND semestre = ?""",
-                (nota1, nota2, nota3, matricula, codigo_disciplina, semestre)
-            )
-            self.conn.commit()
-            
-            if self.cursor.rowcount > 0:
+        cursor = self._exec(
+            SQL_ATUALIZAR_NOTAS,
+            (nota1, nota2, nota3, matricula, codigo_disciplina, semestre)
+        )
+
+        if cursor.rowcount > 0:
+            if self.verbose:
                 media = (nota1 + nota2 + nota3) / 3
                 situacao = "APROVADO" if media >= 7.0 else "REPROVADO"
                 print(f"✓ Notas atualizadas! Nova média: {media:.2f} - Situação: {situacao}")
-                return True
-            else:
-                print("✗ Nenhuma nota encontrada para atualizar!")
-                return False
-        except Exception as e:
-            print(f"✗ Erro ao atualizar notas: {e}")
+            return True
+        else:
+            print("✗ Nenhuma nota encontrada para atualizar!")
             return False
     
     # ==================== CONSULTAS ====================
     
     def ver_situacao_aluno(self, matricula: str) -> List[Dict]:
         """Consulta a situação de um aluno específico"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    a.matricula,
-                    a.nome AS aluno,
-                    d.codigo AS cod_disciplina,
-                    d.nome AS disciplina,
-                    n.nota1,
-                    n.nota2,
-                    n.nota3,
-                    (n.nota1 + n.nota2 + n.nota3) / 3 AS media,
-                    CASE 
-                        WHEN (n.nota1 + n.nota2 + n.nota3) / 3 >= 7.0 THEN 'APROVADO'
-                        ELSE 'REPROVADO'
-                    END AS situacao,
-                    n.semestre
-                FROM notas n
-                INNER JOIN alunos a ON n.aluno_id = a.id
-                INNER JOIN disciplinas d ON n.disciplina_id = d.id
-                WHERE a.matricula = ?
-                ORDER BY d.nome
-            """, (matricula,))
-            
-            resultado = []
-            for row in self.cursor.fetchall():
-                resultado.append({
-                    'matricula': row[0],
-                    'aluno': row[1],
-                    'cod_disciplina': row[2],
-                    'disciplina': row[3],
-                    'nota1': row[4],
-                    'nota2': row[5],
-                    'nota3': row[6],
-                    'media': row[7],
-                    'situacao': row[8],
-                    'semestre': row[9]
-                })
-            return resultado
-        except Exception as e:
-            print(f"✗ Erro ao consultar situação do aluno: {e}")
-            return []
+        cursor = self._exec(SQL_SITUACAO_ALUNO, (matricula,))
+        return [dict(row) for row in cursor]
     
-    def ver_todas_situacoes(self) -> List[Dict]:
-        """Consulta a situação de todos os alunos"""
+    def ver_todas_situacoes(self) -> Iterator[Dict]:
+        """
+        Consulta a situação de todos os alunos
+
+        Produz as linhas em blocos via fetchmany, sem materializar o
+        resultado inteiro em memória.
+        """
+        cursor = self._exec(SQL_TODAS_SITUACOES)
+        cursor.arraysize = 256
+
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from (dict(row) for row in rows)
+
+    def ver_todas_situacoes_np(self):
+        """
+        Versão vetorizada de ver_todas_situacoes usando NumPy (opcional)
+
+        Calcula média e situação de todas as linhas em operações
+        vetorizadas, em vez de uma expressão CASE por linha; indicada
+        para dumps com milhares de notas. Retorna um array estruturado
+        cujos elementos aceitam acesso por nome (ex.: linha['media']),
+        compatível com imprimir_situacao. Sem o pacote numpy instalado,
+        recai na versão iterativa.
+        """
         try:
-            self.cursor.execute("""
-                SELECT 
-                    a.matricula,
-                    a.nome AS aluno,
-                    d.codigo AS cod_disciplina,
-                    d.nome AS disciplina,
-                    n.nota1,
-                    n.nota2,
-                    n.nota3,
-                    (n.nota1 + n.nota2 + n.nota3) / 3 AS media,
-                    CASE 
-                        WHEN (n.nota1 + n.nota2 + n.nota3) / 3 >= 7.0 THEN 'APROVADO'
-                        ELSE 'REPROVADO'
-                    END AS situacao,
-                    n.semestre
-                FROM notas n
-                INNER JOIN alunos a ON n.aluno_id = a.id
-                INNER JOIN disciplinas d ON n.disciplina_id = d.id
-                ORDER BY a.nome, d.nome
-            """)
-            
-            resultado = []
-            for row in self.cursor.fetchall():
-                resultado.append({
-                    'matricula': row[0],
-                    'aluno': row[1],
-                    'cod_disciplina': row[2],
-                    'disciplina': row[3],
-                    'nota1': row[4],
-                    'nota2': row[5],
-                    'nota3': row[6],
-                    'media': row[7],
-                    'situacao': row[8],
-                    'semestre': row[9]
-                })
+            import numpy as np
+        except ImportError:
+            print("✗ NumPy não instalado; usando a versão iterativa")
+            return list(self.ver_todas_situacoes())
+
+        rows = self._exec(SQL_TODAS_SITUACOES_BRUTO).fetchall()
+
+        resultado = np.empty(len(rows), dtype=[
+            ('matricula', 'U20'), ('aluno', 'U60'),
+            ('cod_disciplina', 'U20'), ('disciplina', 'U60'),
+            ('nota1', 'f8'), ('nota2', 'f8'), ('nota3', 'f8'),
+            ('media', 'f8'), ('situacao', 'U9'), ('semestre', 'U10')
+        ])
+        if not rows:
             return resultado
-        except Exception as e:
-            print(f"✗ Erro ao consultar situações: {e}")
-            return []
-    
+
+        dados = np.array([tuple(r) for r in rows], dtype=object)
+        for indice, campo in enumerate(
+                ('matricula', 'aluno', 'cod_disciplina', 'disciplina',
+                 'nota1', 'nota2', 'nota3')):
+            resultado[campo] = dados[:, indice]
+        resultado['semestre'] = dados[:, 7]
+        resultado['media'] = dados[:, 4:7].astype(np.float64).sum(axis=1) / 3
+        resultado['situacao'] = np.where(
+            resultado['media'] >= 7.0, 'APROVADO', 'REPROVADO'
+        )
+        return resultado
+
     def ver_resumo_aluno(self, matricula: str = None) -> List[Dict]:
         """Consulta o resumo de um aluno ou de todos os alunos"""
-        try:
-            if matricula:
-                query = """
-                    SELECT 
-                        a.matricula,
-                        a.nome,
-                        n.semestre,
-                        COUNT(*) AS total_disciplinas,
-                        SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 >= 7.0 THEN 1 ELSE 0 END) AS aprovado,
-                        SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 < 7.0 THEN 1 ELSE 0 END) AS reprovado,
-                        ROUND(AVG((n.nota1 + n.nota2 + n.nota3) / 3), 2) AS media_geral
-                    FROM alunos a
-                    INNER JOIN notas n ON a.id = n.aluno_id
-                    WHERE a.matricula = ?
-                    GROUP BY a.matricula, a.nome, n.semestre
-                    ORDER BY a.nome
-                """
-                self.cursor.execute(query, (matricula,))
-            else:
-                query = """
-                    SELECT 
-                        a.matricula,
-                        a.nome,
-                        n.semestre,
-                        COUNT(*) AS total_disciplinas,
-                        SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 >= 7.0 THEN 1 ELSE 0 END) AS aprovado,
-                        SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 < 7.0 THEN 1 ELSE 0 END) AS reprovado,
-                        ROUND(AVG((n.nota1 + n.nota2 + n.nota3) / 3), 2) AS media_geral
-                    FROM alunos a
-                    INNER JOIN notas n ON a.id = n.aluno_id
-                    GROUP BY a.matricula, a.nome, n.semestre
-                    ORDER BY a.nome
-                """
-                self.cursor.execute(query)
-            
-            resultado = []
-            for row in self.cursor.fetchall():
-                resultado.append({
-                    'matricula': row[0],
-                    'nome': row[1],
-                    'semestre': row[2],
-                    'total_disciplinas': row[3],
-                    'aprovado': row[4],
-                    'reprovado': row[5],
-                    'media_geral': row[6]
-                })
-            return resultado
-        except Exception as e:
-            print(f"✗ Erro ao consultar resumo: {e}")
-            return []
+        # Filtro opcional embutido na própria consulta: um único
+        # statement preparado cobre os dois casos
+        cursor = self._exec(SQL_RESUMO_ALUNO, {'mat': matricula})
+        return [dict(row) for row in cursor]
     
     def listar_aprovados(self) -> List[Dict]:
         """Lista alunos aprovados em todas as disciplinas"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    a.matricula,
-                    a.nome,
-                    n.semestre,
-                    COUNT(*) AS total_disciplinas,
-                    ROUND(AVG((n.nota1 + n.nota2 + n.nota3) / 3), 2) AS media_geral
-                FROM alunos a
-                INNER JOIN notas n ON a.id = n.aluno_id
-                GROUP BY a.matricula, a.nome, n.semestre
-                HAVING SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 < 7.0 THEN 1 ELSE 0 END) = 0
-                ORDER BY media_geral DESC
-            """)
-            
-            resultado = []
-            for row in self.cursor.fetchall():
-                resultado.append({
-                    'matricula': row[0],
-                    'nome': row[1],
-                    'semestre': row[2],
-                    'total_disciplinas': row[3],
-                    'media_geral': row[4]
-                })
-            return resultado
-        except Exception as e:
-            print(f"✗ Erro ao listar aprovados: {e}")
-            return []
+        cursor = self._exec(SQL_APROVADOS)
+        return [dict(row) for row in cursor]
     
     def listar_reprovados(self) -> List[Dict]:
         """Lista alunos com alguma reprovação"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    a.matricula,
-                    a.nome,
-                    n.semestre,
-                    SUM(CASE WHEN (n.nota1 + n.nota2 + n.nota3) / 3 < 7.0 THEN 1 ELSE 0 END) AS disciplinas_reprovadas,
-                    ROUND(AVG((n.nota1 + n.nota2 + n.nota3) / 3), 2) AS media_geral
-                FROM alunos a
-                INNER JOIN notas n ON a.id = n.aluno_id
-                GROUP BY a.matricula, a.nome, n.semestre
-                HAVING disciplinas_reprovadas > 0
-                ORDER BY disciplinas_reprovadas DESC, media_geral ASC
-            """)
-            
-            resultado = []
-            for row in self.cursor.fetchall():
-                resultado.append({
-                    'matricula': row[0],
-                    'nome': row[1],
-                    'semestre': row[2],
-                    'disciplinas_reprovadas': row[3],
-                    'media_geral': row[4]
-                })
-            return resultado
-        except Exception as e:
-            print(f"✗ Erro ao listar reprovados: {e}")
-            return []
+        cursor = self._exec(SQL_REPROVADOS)
+        return [dict(row) for row in cursor]
     
     def estatisticas_semestre(self, semestre: str) -> Optional[Dict]:
         """Consulta estatísticas gerais de um semestre"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    ? AS semestre,
-                    COUNT(DISTINCT aluno_id) AS total_alunos,
-                    COUNT(*) AS total_matriculas,
-                    SUM(CASE WHEN (nota1 + nota2 + nota3) / 3 >= 7.0 THEN 1 ELSE 0 END) AS total_aprovacoes,
-                    SUM(CASE WHEN (nota1 + nota2 + nota3) / 3 < 7.0 THEN 1 ELSE 0 END) AS total_reprovacoes,
-                    ROUND(AVG((nota1 + nota2 + nota3) / 3), 2) AS media_geral,
-                    ROUND(100.0 * SUM(CASE WHEN (nota1 + nota2 + nota3) / 3 >= 7.0 THEN 1 ELSE 0 END) / COUNT(*), 2) AS taxa_aprovacao
-                FROM notas
-                WHERE semestre = ?
-            """, (semestre, semestre))
-            
-            row = self.cursor.fetchone()
-            if row and row[1] > 0:  # Se há alunos
-                return {
-                    'semestre': row[0],
-                    'total_alunos': row[1],
-                    'total_matriculas': row[2],
-                    'total_aprovacoes': row[3],
-                    'total_reprovacoes': row[4],
-                    'media_geral': row[5],
-                    'taxa_aprovacao': row[6]
-                }
-            return None
-        except Exception as e:
-            print(f"✗ Erro ao consultar estatísticas: {e}")
-            return None
+        cursor = self._exec(SQL_ESTATISTICAS_SEMESTRE, (semestre, semestre))
+        row = cursor.fetchone()
+        if row and row['total_alunos'] > 0:  # Se há alunos
+            return dict(row)
+        return None
     
     def inserir_dados_exemplo(self):
         """Insere dados de exemplo no banco"""
@@ -484,9 +512,6 @@ class SistemaNotas:
             ('2024005', 'Carlos Souza')
         ]
         
-        for matricula, nome in alunos:
-            self.adicionar_aluno(matricula, nome)
-        
         # Disciplinas
         disciplinas = [
             ('MAT101', 'Matemática I', 60),
@@ -496,9 +521,6 @@ class SistemaNotas:
             ('QUI101', 'Química I', 60)
         ]
         
-        for codigo, nome, carga in disciplinas:
-            self.adicionar_disciplina(codigo, nome, carga)
-        
         # Notas
         notas = [
             ('2024001', 'MAT101', 8.5, 7.0, 9.0, '2024.1'),
@@ -520,10 +542,42 @@ class SistemaNotas:
             ('2024003', 'QUI101', 9.0, 8.0, 8.5, '2024.1'),
         ]
         
-        for matricula, codigo, n1, n2, n3, sem in notas:
-            self.adicionar_notas(matricula, codigo, n1, n2, n3, sem)
-        
-        print("\n✓ Dados de exemplo inseridos com sucesso!")
+        # Uma única transação: o commit em grupo amortiza o fsync e evita
+        # um commit (e duas buscas de ID) por linha inserida
+        verbose_anterior = self.verbose
+        self.verbose = False
+        try:
+            inicio = time.perf_counter()
+            self._inserir_em_lote(alunos, disciplinas, notas)
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+            total = len(alunos) + len(disciplinas) + len(notas)
+            print(f"\n✓ {total} registros inseridos em {duracao_ms:.1f} ms")
+        except sqlite3.IntegrityError:
+            print("\n✗ Erro: Dados de exemplo já foram inseridos!")
+        finally:
+            self.verbose = verbose_anterior
+
+    def _inserir_em_lote(self, alunos, disciplinas, notas):
+        """Insere alunos, disciplinas e notas em uma única transação"""
+        with self.transaction():
+            self.cursor.executemany(SQL_INSERIR_ALUNO, alunos)
+            self.cursor.executemany(SQL_INSERIR_DISCIPLINA, disciplinas)
+
+            # Resolve os IDs uma vez só, em vez de dois SELECTs por nota
+            alunos_ids = dict(
+                self.cursor.execute("SELECT matricula, id FROM alunos").fetchall()
+            )
+            disciplinas_ids = dict(
+                self.cursor.execute("SELECT codigo, id FROM disciplinas").fetchall()
+            )
+
+            self.cursor.executemany(
+                SQL_INSERIR_NOTAS,
+                [
+                    (alunos_ids[matricula], disciplinas_ids[codigo], n1, n2, n3, sem)
+                    for matricula, codigo, n1, n2, n3, sem in notas
+                ]
+            )
 
 
 # ==================== FUNÇÕES DE IMPRESSÃO ====================
@@ -563,20 +617,27 @@ def imprimir_disciplinas(disciplinas: List[Dict]):
     print(f"Total: {len(disciplinas)} disciplina(s)")
 
 
-def imprimir_situacao(situacoes: List[Dict]):
-    """Imprime situação dos alunos formatada"""
-    if not situacoes:
+def imprimir_situacao(situacoes: Iterable[Dict]):
+    """Imprime situação dos alunos formatada (aceita lista ou gerador)"""
+    # Template compilado uma vez fora do laço; as linhas são acumuladas
+    # e gravadas em uma única chamada para evitar um print por linha
+    fmt = "{:<12} {:<20} {:<20} {:<6.2f} {:<6.2f} {:<6.2f} {:<7.2f} {:<12}\n".format
+    separador = "=" * 100 + "\n"
+    linhas = []
+    for s in situacoes:
+        if not linhas:
+            linhas.append(separador)
+            linhas.append(f"{'Matrícula':<12} {'Aluno':<20} {'Disciplina':<20} {'N1':<6} {'N2':<6} {'N3':<6} {'Média':<7} {'Situação':<12}\n")
+            linhas.append(separador)
+        linhas.append(fmt(s['matricula'], s['aluno'], s['disciplina'],
+                          s['nota1'], s['nota2'], s['nota3'],
+                          s['media'], s['situacao']))
+
+    if not linhas:
         print("Nenhuma informação encontrada.")
         return
-    
-    imprimir_linha(100)
-    print(f"{'Matrícula':<12} {'Aluno':<20} {'Disciplina':<20} {'N1':<6} {'N2':<6} {'N3':<6} {'Média':<7} {'Situação':<12}")
-    imprimir_linha(100)
-    for s in situacoes:
-        print(f"{s['matricula']:<12} {s['aluno']:<20} {s['disciplina']:<20} "
-              f"{s['nota1']:<6.2f} {s['nota2']:<6.2f} {s['nota3']:<6.2f} "
-              f"{s['media']:<7.2f} {s['situacao']:<12}")
-    imprimir_linha(100)
+    linhas.append(separador)
+    sys.stdout.write("".join(linhas))
 
 
 def imprimir_resumo(resumos: List[Dict]):
@@ -585,13 +646,20 @@ def imprimir_resumo(resumos: List[Dict]):
         print("Nenhuma informação encontrada.")
         return
     
-    imprimir_linha(90)
-    print(f"{'Matrícula':<12} {'Nome':<25} {'Semestre':<10} {'Total':<8} {'Aprov.':<8} {'Reprov.':<8} {'Média':<8}")
-    imprimir_linha(90)
-    for r in resumos:
-        print(f"{r['matricula']:<12} {r['nome']:<25} {r['semestre']:<10} "
-              f"{r['total_disciplinas']:<8} {r['aprovado']:<8} {r['reprovado']:<8} {r['media_geral']:<8.2f}")
-    imprimir_linha(90)
+    fmt = "{:<12} {:<25} {:<10} {:<8} {:<8} {:<8} {:<8.2f}\n".format
+    separador = "=" * 90 + "\n"
+    linhas = [
+        separador,
+        f"{'Matrícula':<12} {'Nome':<25} {'Semestre':<10} {'Total':<8} {'Aprov.':<8} {'Reprov.':<8} {'Média':<8}\n",
+        separador,
+    ]
+    linhas.extend(
+        fmt(r['matricula'], r['nome'], r['semestre'], r['total_disciplinas'],
+            r['aprovado'], r['reprovado'], r['media_geral'])
+        for r in resumos
+    )
+    linhas.append(separador)
+    sys.stdout.write("".join(linhas))
 
 
 # ==================== MENU INTERATIVO ====================
@@ -629,121 +697,133 @@ def executar_menu():
     except:
         print("\n✗ Não foi possível inicializar o banco de dados. Encerrando...")
         return
-    
+
+    with sistema:
+        _loop_menu(sistema)
+
+
+def _loop_menu(sistema: SistemaNotas):
+    """Laço principal do menu interativo"""
     while True:
         menu_principal()
         opcao = input("\nEscolha uma opção: ").strip()
         
-        if opcao == "1":
-            print("\n--- ADICIONAR ALUNO ---")
-            matricula = input("Matrícula: ").strip()
-            nome = input("Nome completo: ").strip()
-            sistema.adicionar_aluno(matricula, nome)
+        # Tratamento de erro centralizado: os métodos de consulta são
+        # código reto e qualquer falha do sqlite3 é capturada aqui
+        try:
+            if opcao == "1":
+                print("\n--- ADICIONAR ALUNO ---")
+                matricula = input("Matrícula: ").strip()
+                nome = input("Nome completo: ").strip()
+                sistema.adicionar_aluno(matricula, nome)
         
-        elif opcao == "2":
-            print("\n--- LISTA DE ALUNOS ---")
-            alunos = sistema.listar_alunos()
-            imprimir_alunos(alunos)
+            elif opcao == "2":
+                print("\n--- LISTA DE ALUNOS ---")
+                alunos = sistema.listar_alunos()
+                imprimir_alunos(alunos)
         
-        elif opcao == "3":
-            print("\n--- ADICIONAR DISCIPLINA ---")
-            codigo = input("Código: ").strip()
-            nome = input("Nome: ").strip()
-            carga = int(input("Carga horária: ").strip())
-            sistema.adicionar_disciplina(codigo, nome, carga)
+            elif opcao == "3":
+                print("\n--- ADICIONAR DISCIPLINA ---")
+                codigo = input("Código: ").strip()
+                nome = input("Nome: ").strip()
+                carga = int(input("Carga horária: ").strip())
+                sistema.adicionar_disciplina(codigo, nome, carga)
         
-        elif opcao == "4":
-            print("\n--- LISTA DE DISCIPLINAS ---")
-            disciplinas = sistema.listar_disciplinas()
-            imprimir_disciplinas(disciplinas)
+            elif opcao == "4":
+                print("\n--- LISTA DE DISCIPLINAS ---")
+                disciplinas = sistema.listar_disciplinas()
+                imprimir_disciplinas(disciplinas)
         
-        elif opcao == "5":
-            print("\n--- ADICIONAR NOTAS ---")
-            matricula = input("Matrícula do aluno: ").strip()
-            codigo = input("Código da disciplina: ").strip()
-            nota1 = float(input("Nota 1 (0-10): ").strip())
-            nota2 = float(input("Nota 2 (0-10): ").strip())
-            nota3 = float(input("Nota 3 (0-10): ").strip())
-            semestre = input("Semestre (ex: 2024.1): ").strip()
-            sistema.adicionar_notas(matricula, codigo, nota1, nota2, nota3, semestre)
+            elif opcao == "5":
+                print("\n--- ADICIONAR NOTAS ---")
+                matricula = input("Matrícula do aluno: ").strip()
+                codigo = input("Código da disciplina: ").strip()
+                nota1 = float(input("Nota 1 (0-10): ").strip())
+                nota2 = float(input("Nota 2 (0-10): ").strip())
+                nota3 = float(input("Nota 3 (0-10): ").strip())
+                semestre = input("Semestre (ex: 2024.1): ").strip()
+                sistema.adicionar_notas(matricula, codigo, nota1, nota2, nota3, semestre)
         
-        elif opcao == "6":
-            print("\n--- ATUALIZAR NOTAS ---")
-            matricula = input("Matrícula do aluno: ").strip()
-            codigo = input("Código da disciplina: ").strip()
-            semestre = input("Semestre (ex: 2024.1): ").strip()
-            nota1 = float(input("Nova Nota 1 (0-10): ").strip())
-            nota2 = float(input("Nova Nota 2 (0-10): ").strip())
-            nota3 = float(input("Nova Nota 3 (0-10): ").strip())
-            sistema.atualizar_notas(matricula, codigo, nota1, nota2, nota3, semestre)
+            elif opcao == "6":
+                print("\n--- ATUALIZAR NOTAS ---")
+                matricula = input("Matrícula do aluno: ").strip()
+                codigo = input("Código da disciplina: ").strip()
+                semestre = input("Semestre (ex: 2024.1): ").strip()
+                nota1 = float(input("Nova Nota 1 (0-10): ").strip())
+                nota2 = float(input("Nova Nota 2 (0-10): ").strip())
+                nota3 = float(input("Nova Nota 3 (0-10): ").strip())
+                sistema.atualizar_notas(matricula, codigo, nota1, nota2, nota3, semestre)
         
-        elif opcao == "7":
-            print("\n--- SITUAÇÃO DO ALUNO ---")
-            matricula = input("Matrícula: ").strip()
-            situacoes = sistema.ver_situacao_aluno(matricula)
-            imprimir_situacao(situacoes)
+            elif opcao == "7":
+                print("\n--- SITUAÇÃO DO ALUNO ---")
+                matricula = input("Matrícula: ").strip()
+                situacoes = sistema.ver_situacao_aluno(matricula)
+                imprimir_situacao(situacoes)
         
-        elif opcao == "8":
-            print("\n--- SITUAÇÃO DE TODOS OS ALUNOS ---")
-            situacoes = sistema.ver_todas_situacoes()
-            imprimir_situacao(situacoes)
+            elif opcao == "8":
+                print("\n--- SITUAÇÃO DE TODOS OS ALUNOS ---")
+                situacoes = sistema.ver_todas_situacoes()
+                imprimir_situacao(situacoes)
         
-        elif opcao == "9":
-            print("\n--- RESUMO DO ALUNO ---")
-            matricula = input("Matrícula: ").strip()
-            resumos = sistema.ver_resumo_aluno(matricula)
-            imprimir_resumo(resumos)
+            elif opcao == "9":
+                print("\n--- RESUMO DO ALUNO ---")
+                matricula = input("Matrícula: ").strip()
+                resumos = sistema.ver_resumo_aluno(matricula)
+                imprimir_resumo(resumos)
         
-        elif opcao == "10":
-            print("\n--- RESUMO DE TODOS OS ALUNOS ---")
-            resumos = sistema.ver_resumo_aluno()
-            imprimir_resumo(resumos)
+            elif opcao == "10":
+                print("\n--- RESUMO DE TODOS OS ALUNOS ---")
+                resumos = sistema.ver_resumo_aluno()
+                imprimir_resumo(resumos)
         
-        elif opcao == "11":
-            print("\n--- ALUNOS APROVADOS ---")
-            aprovados = sistema.listar_aprovados()
-            imprimir_resumo(aprovados)
+            elif opcao == "11":
+                print("\n--- ALUNOS APROVADOS ---")
+                aprovados = sistema.listar_aprovados()
+                imprimir_resumo(aprovados)
         
-        elif opcao == "12":
-            print("\n--- ALUNOS REPROVADOS ---")
-            reprovados = sistema.listar_reprovados()
-            if reprovados:
-                imprimir_linha(80)
-                print(f"{'Matrícula':<12} {'Nome':<25} {'Semestre':<10} {'Reprov.':<10} {'Média':<8}")
-                imprimir_linha(80)
-                for r in reprovados:
-                    print(f"{r['matricula']:<12} {r['nome']:<25} {r['semestre']:<10} "
-                          f"{r['disciplinas_reprovadas']:<10} {r['media_geral']:<8.2f}")
-                imprimir_linha(80)
+            elif opcao == "12":
+                print("\n--- ALUNOS REPROVADOS ---")
+                reprovados = sistema.listar_reprovados()
+                if reprovados:
+                    imprimir_linha(80)
+                    print(f"{'Matrícula':<12} {'Nome':<25} {'Semestre':<10} {'Reprov.':<10} {'Média':<8}")
+                    imprimir_linha(80)
+                    for r in reprovados:
+                        print(f"{r['matricula']:<12} {r['nome']:<25} {r['semestre']:<10} "
+                              f"{r['disciplinas_reprovadas']:<10} {r['media_geral']:<8.2f}")
+                    imprimir_linha(80)
         
-        elif opcao == "13":
-            print("\n--- ESTATÍSTICAS DO SEMESTRE ---")
-            semestre = input("Semestre (ex: 2024.1): ").strip()
-            stats = sistema.estatisticas_semestre(semestre)
-            if stats:
-                imprimir_linha()
-                print(f"Semestre: {stats['semestre']}")
-                print(f"Total de alunos: {stats['total_alunos']}")
-                print(f"Total de matrículas: {stats['total_matriculas']}")
-                print(f"Aprovações: {stats['total_aprovacoes']}")
-                print(f"Reprovações: {stats['total_reprovacoes']}")
-                print(f"Média geral: {stats['media_geral']:.2f}")
-                print(f"Taxa de aprovação: {stats['taxa_aprovacao']:.2f}%")
-                imprimir_linha()
-            else:
-                print("✗ Nenhum dado encontrado para este semestre.")
+            elif opcao == "13":
+                print("\n--- ESTATÍSTICAS DO SEMESTRE ---")
+                semestre = input("Semestre (ex: 2024.1): ").strip()
+                stats = sistema.estatisticas_semestre(semestre)
+                if stats:
+                    imprimir_linha()
+                    print(f"Semestre: {stats['semestre']}")
+                    print(f"Total de alunos: {stats['total_alunos']}")
+                    print(f"Total de matrículas: {stats['total_matriculas']}")
+                    print(f"Aprovações: {stats['total_aprovacoes']}")
+                    print(f"Reprovações: {stats['total_reprovacoes']}")
+                    print(f"Média geral: {stats['media_geral']:.2f}")
+                    print(f"Taxa de aprovação: {stats['taxa_aprovacao']:.2f}%")
+                    imprimir_linha()
+                else:
+                    print("✗ Nenhum dado encontrado para este semestre.")
         
-        elif opcao == "14":
-            confirmacao = input("Deseja inserir dados de exemplo? (s/n): ").strip().lower()
-            if confirmacao == 's':
-                sistema.inserir_dados_exemplo()
+            elif opcao == "14":
+                confirmacao = input("Deseja inserir dados de exemplo? (s/n): ").strip().lower()
+                if confirmacao == 's':
+                    sistema.inserir_dados_exemplo()
         
-        elif opcao == "0":
-            print("\nEncerrando sistema...")
-            break
+            elif opcao == "0":
+                print("\nEncerrando sistema...")
+                break
         
-        else:
-            print("\n✗ Opção inválida! Tente novamente.")
+            else:
+                print("\n✗ Opção inválida! Tente novamente.")
+        
+        except Exception as e:
+            print(f"\n✗ Erro: {e}")
         
         input("\nPressione ENTER para continuar...")
 